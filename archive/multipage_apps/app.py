@@ -7,7 +7,9 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-st.markdown("""
+# Page CSS lives in module constants so reruns re-send one prebuilt string
+# instead of re-allocating the blobs and emitting several markdown deltas
+SIDEBAR_CSS = """
     <style>
     /* Obliterate sidebar */
     [data-testid="stSidebar"], [data-testid="collapsedControl"] {
@@ -27,28 +29,29 @@ st.markdown("""
         padding-right: 1rem !important;
     }
     </style>
-""", unsafe_allow_html=True)
-
-import pandas as pd
-import json
-from datetime import datetime, timedelta
-import random
-
-# Check Streamlit version for multipage compatibility
-try:
-    import streamlit as st
-    st_version = st.__version__
-    major, minor = map(int, st_version.split('.')[:2])
-    if major < 1 or (major == 1 and minor < 10):
-        st.error(f"⚠️ Streamlit {st_version} detected. Multipage requires 1.10+")
-except:
-    pass
+"""
+
+import streamlit.components.v1 as components
+
+# st.fragment stabilized after the streamlit release we pin; fall back to the
+# experimental name, and to a no-op (full reruns) if neither exists
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+if _fragment is None:
+    def _fragment(func):
+        return func
+
+# Load Inter via link tags rather than a CSS @import - @import serializes
+# behind the stylesheet parse, while preconnect + stylesheet link lets the
+# browser start the font fetch immediately
+FONT_LINKS = """
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap">
+"""
 
 # Science.io-inspired CSS styling
-st.markdown("""
+PAGE_CSS = """
 <style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
     /* Global styling */
     html, body, [class*="css"] {
         font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
@@ -73,36 +76,7 @@ st.markdown("""
     }
     
     /* JavaScript for smooth scrolling */
-</style>
-<script>
-    // Enhanced smooth scrolling with easing
-    function smoothScrollTo(elementId) {
-        const element = document.getElementById(elementId);
-        if (element) {
-            const yOffset = -80; // Offset for fixed navbar
-            const y = element.getBoundingClientRect().top + window.pageYOffset + yOffset;
-            
-            window.scrollTo({
-                top: y,
-                behavior: 'smooth'
-            });
-        }
-    }
-    
-    // Wait for Streamlit to load
-    setTimeout(function() {
-        // Override anchor link clicks
-        const links = document.querySelectorAll('a[href^="#"]');
-        links.forEach(link => {
-            link.addEventListener('click', function(e) {
-                e.preventDefault();
-                const targetId = this.getAttribute('href').substring(1);
-                smoothScrollTo(targetId);
-            });
-        });
-    }, 100);
-</script>
-<style>
+
     
     /* Content container */
     .content-container {
@@ -124,22 +98,6 @@ st.markdown("""
         box-shadow: 0 20px 40px rgba(37, 99, 235, 0.08);
     }
     
-    .hero-section::before {
-        content: '';
-        position: absolute;
-        top: -50%;
-        right: -50%;
-        width: 200%;
-        height: 200%;
-        background: radial-gradient(circle, rgba(37, 99, 235, 0.03) 0%, transparent 70%);
-        animation: pulse 15s ease-in-out infinite;
-    }
-    
-    @keyframes pulse {
-        0%, 100% { transform: scale(0.8); opacity: 0.5; }
-        50% { transform: scale(1.2); opacity: 0.8; }
-    }
-    
     .hero-section h1 {
         color: #111827 !important;
         font-size: 3.75rem !important;
@@ -273,6 +231,45 @@ st.markdown("""
         margin-bottom: 3rem !important;
     }
     
+    /* Anchor-link navbar */
+    .fa-nav {
+        display: flex;
+        align-items: center;
+        gap: 2rem;
+        padding: 0.75rem 2rem;
+        border-bottom: 1px solid #e5e7eb;
+    }
+
+    .fa-nav-brand {
+        font-size: 1.5rem;
+        font-weight: 700;
+        color: #111827;
+        margin-right: auto;
+    }
+
+    .fa-nav a {
+        color: #6b7280;
+        text-decoration: none;
+        font-weight: 500;
+        transition: color 0.3s ease;
+    }
+
+    .fa-nav a:hover {
+        color: #2563eb;
+    }
+
+    .fa-nav a.fa-nav-cta {
+        background: #2563eb;
+        color: white;
+        padding: 0.5rem 1.25rem;
+        border-radius: 6px;
+        font-weight: 600;
+    }
+
+    .fa-nav a.fa-nav-cta:hover {
+        background: #1d4ed8;
+    }
+
     /* Hide Streamlit elements */
     .stDeployButton {display: none;}
     footer {visibility: hidden;}
@@ -282,48 +279,7 @@ st.markdown("""
     .stSidebar {display: none;}
     section[data-testid="stSidebar"] {display: none;}
     
-    /* Navigation button styling */
-    div[data-testid="column"]:nth-child(2) .stButton > button,
-    div[data-testid="column"]:nth-child(3) .stButton > button,
-    div[data-testid="column"]:nth-child(4) .stButton > button {
-        background: transparent !important;
-        color: #6b7280 !important;
-        border: none !important;
-        border-radius: 0.375rem !important;
-        padding: 0.5rem 1rem !important;
-        font-weight: 500 !important;
-        font-family: 'Inter', sans-serif !important;
-        transition: all 0.3s ease !important;
-        font-size: 0.9rem !important;
-    }
-    
-    div[data-testid="column"]:nth-child(2) .stButton > button:hover,
-    div[data-testid="column"]:nth-child(3) .stButton > button:hover,
-    div[data-testid="column"]:nth-child(4) .stButton > button:hover {
-        background: #f3f4f6 !important;
-        color: #2563eb !important;
-        transform: none !important;
-    }
-    
-    /* Primary CTA button styling */
-    div[data-testid="column"]:nth-child(5) .stButton > button {
-        background: #2563eb !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 0.5rem !important;
-        padding: 0.75rem 1.5rem !important;
-        font-weight: 600 !important;
-        font-family: 'Inter', sans-serif !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    div[data-testid="column"]:nth-child(5) .stButton > button:hover {
-        background: #1d4ed8 !important;
-        transform: translateY(-1px) !important;
-        box-shadow: 0 4px 12px rgba(37, 99, 235, 0.3) !important;
-    }
-    
-    /* Regular button styling for other buttons */
+    /* Single button style - nav links are plain anchors styled via .fa-nav */
     .stButton > button {
         background: #2563eb !important;
         color: white !important;
@@ -346,11 +302,64 @@ st.markdown("""
     .stButton {
         position: static !important;
     }
+
+    /* Center standalone CTA buttons without spinning up column widgets.
+       The .center-cta div is an empty marker inside its own markdown
+       element container; :has() flags that container so the button in the
+       next element container gets flex-centered */
+    div[data-testid="element-container"]:has(.center-cta) {
+        margin: 0;
+    }
+
+    div[data-testid="element-container"]:has(.center-cta) + div[data-testid="element-container"] .stButton {
+        display: flex;
+        justify-content: center;
+        margin: 1rem 0;
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
 
+# One delegated click listener, bound a single time per page load instead of
+# per-link listeners rebound on every rerun. The rAF defers the scroll math
+# to the browser's paint cycle. Runs through components.html because scripts
+# in st.markdown are never executed.
+NAV_SCROLL_JS = """
+<script>
+(function() {
+    const win = window.parent;
+    if (win.__faNavBound) return;
+    win.__faNavBound = true;
+    win.document.addEventListener('click', function(e) {
+        const a = e.target.closest('a[href^="#"]');
+        if (!a) return;
+        e.preventDefault();
+        const id = a.getAttribute('href').slice(1);
+        requestAnimationFrame(function() {
+            const el = win.document.getElementById(id);
+            if (el) {
+                win.scrollTo({
+                    top: el.getBoundingClientRect().top + win.pageYOffset - 80,
+                    behavior: 'smooth'
+                });
+            }
+        });
+    }, {passive: false});
+})();
+</script>
+"""
+
+# Single markdown delta for the font links and all page styling
+st.markdown(FONT_LINKS + SIDEBAR_CSS + PAGE_CSS, unsafe_allow_html=True)
+components.html(NAV_SCROLL_JS, height=0)
+
+@st.cache_resource
 def get_demo_data():
-    """Generate realistic demo data for the fleet audit"""
+    """Generate realistic demo data for the fleet audit.
+
+    Cached as a resource (not data) because the scenarios dict is static and
+    read-only - cache_resource hands back the same object without the
+    per-rerun deep copy cache_data would do.
+    """
     
     # Sample scenarios
     scenarios = {
@@ -464,191 +473,98 @@ def get_demo_data():
             }
         }
     }
-    
+
+    # Derive the counts the results panel needs so they're computed once per
+    # process instead of on every rerun
+    for scenario in scenarios.values():
+        violations = scenario["violations"]
+        scenario["summary"]["n_violations"] = len(violations)
+        scenario["summary"]["n_high"] = sum(
+            1 for v in violations if v.get("severity") == "high"
+        )
+
     return scenarios
 
+# Resolved once per process; reruns just reuse the cached dict
+DEMO_DATA = get_demo_data()
+
+def _row(label, value):
+    """One list item for a violation detail line"""
+    return f"<li><b>{label}:</b> {value}</li>"
+
 def display_demo_results(scenario_name, scenario_data):
     """Display demo results that look like real fraud detection output"""
     
     violations = scenario_data["violations"]
     summary = scenario_data["summary"]
     
-    # Summary metrics
+    # Summary metrics - counts are precomputed in get_demo_data
+    n_violations = summary['n_violations']
+    high_risk = summary['n_high']
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("🚨 Violations Found", len(violations), delta=f"{len(violations)} issues")
+        st.metric("🚨 Violations Found", n_violations, delta=f"{n_violations} issues")
     with col2:
         total_loss = summary.get('total_estimated_loss', 0)
         st.metric("💰 Estimated Loss", f"${total_loss:.2f}", delta=f"-${total_loss:.2f}")
     with col3:
-        high_risk = len([v for v in violations if v.get('severity') == 'high'])
         st.metric("⚠️ High Risk", high_risk, delta=f"{high_risk} critical")
     
     st.markdown("---")
     
-    # Display violations
+    # Display violations - bind each reused field once, then emit the details
+    # as a single markdown list per expander instead of one st.write per line
     for violation in violations:
+        description = violation.get('description', 'No description')
+        severity = violation.get('severity', 'Unknown').upper()
+        loss = violation.get('estimated_loss')
+
         if violation.get('type') == 'shared_card_use':
-            card_info = f"Card ****{violation.get('card_last_4', 'Unknown')}"
+            card = violation.get('card_last_4', 'Unknown')
             vehicles = ', '.join(violation.get('vehicles_involved', []))
-            with st.expander(f"**Shared Card Use** - {card_info} ({vehicles})"):
-                st.write(f"**Card Last 4:** ****{violation.get('card_last_4', 'Unknown')}")
-                st.write(f"**Vehicles Involved:** {', '.join(violation.get('vehicles_involved', []))}")
-                st.write(f"**Drivers Involved:** {', '.join(violation.get('drivers_involved', []))}")
-                st.write(f"**Time Span:** {violation.get('time_span_minutes', 'Unknown')} minutes")
-                st.write(f"**Description:** {violation.get('description', 'No description')}")
-                st.write(f"**Severity:** {violation.get('severity', 'Unknown').upper()}")
-                if violation.get('estimated_loss'):
-                    st.write(f"**Estimated Loss:** ${violation['estimated_loss']:.2f}")
+            drivers = ', '.join(violation.get('drivers_involved', []))
+            title = f"**Shared Card Use** - Card ****{card} ({vehicles})"
+            pairs = [
+                ('Card Last 4', f"****{card}"),
+                ('Vehicles Involved', vehicles),
+                ('Drivers Involved', drivers),
+                ('Time Span', f"{violation.get('time_span_minutes', 'Unknown')} minutes"),
+                ('Description', description),
+                ('Severity', severity),
+                ('Estimated Loss', f"${loss:.2f}" if loss else None),
+            ]
         else:
             # Handle regular violations
-            driver_info = f"{violation.get('driver_name', 'Unknown Driver')} ({violation.get('vehicle_id', 'Unknown Vehicle')})"
+            driver = violation.get('driver_name')
+            vehicle = violation.get('vehicle_id')
+            card = violation.get('card_last_4')
             violation_title = violation.get('type', 'Unknown').replace('_', ' ').title()
-            with st.expander(f"**{violation_title}** - {driver_info}"):
-                st.write(f"**Driver:** {violation.get('driver_name', 'Unknown')}")
-                st.write(f"**Vehicle:** {violation.get('vehicle_id', 'Unknown')}")
-                st.write(f"**Time:** {violation.get('timestamp', 'Unknown')}")
-                if violation.get('location'):
-                    st.write(f"**Location:** {violation.get('location', 'Unknown')}")
-                if violation.get('address'):
-                    st.write(f"**Job Address:** {violation.get('address', 'Unknown')}")
-                if violation.get('card_last_4'):
-                    st.write(f"**Card Used:** ****{violation['card_last_4']}")
-                st.write(f"**Description:** {violation.get('description', 'No description')}")
-                st.write(f"**Severity:** {violation.get('severity', 'Unknown').upper()}")
-                if violation.get('estimated_loss'):
-                    st.write(f"**Estimated Loss:** ${violation['estimated_loss']:.2f}")
-
-def init_global_session_state():
-    """Initialize session state variables that should persist across all pages"""
-    if 'navigation_initialized' not in st.session_state:
-        st.session_state.navigation_initialized = True
-    if 'current_page' not in st.session_state:
-        st.session_state.current_page = 'landing'
-
-def navbar():
-    st.markdown("##", unsafe_allow_html=True)  # spacer
-    cols = st.columns([1, 4, 1, 1, 1, 1])  # Added space for CTA
-
-    with cols[0]:
-        st.markdown("### 🚚 FleetAudit", unsafe_allow_html=True)
-    with cols[1]:
-        pass
-    with cols[2]:
-        if st.button("Features"):
-            st.session_state.scroll_to = "features"
-    with cols[3]:
-        if st.button("Demo"):
-            st.session_state.scroll_to = "demo"
-    with cols[4]:
-        if st.button("Pricing"):
-            st.session_state.scroll_to = "pricing"
-    with cols[5]:
-        st.markdown(
-            """
-            <style>
-            .blue-button > button {
-                background-color: #2563eb;
-                color: white;
-                font-weight: 600;
-                border-radius: 6px;
-                padding: 0.5rem 1.25rem;
-            }
-            .blue-button > button:hover {
-                background-color: #1d4ed8;
-            }
-            </style>
-            """,
-            unsafe_allow_html=True
-        )
-        with st.container():
-            cta = st.container()
-            with cta:
-                if st.button("Try FleetAudit", key="cta"):
-                    st.switch_page("pages/1_Product.py")
-        st.markdown('<div class="blue-button"></div>', unsafe_allow_html=True)
+            title = f"**{violation_title}** - {driver or 'Unknown Driver'} ({vehicle or 'Unknown Vehicle'})"
+            pairs = [
+                ('Driver', driver or 'Unknown'),
+                ('Vehicle', vehicle or 'Unknown'),
+                ('Time', violation.get('timestamp', 'Unknown')),
+                ('Location', violation.get('location')),
+                ('Job Address', violation.get('address')),
+                ('Card Used', f"****{card}" if card else None),
+                ('Description', description),
+                ('Severity', severity),
+                ('Estimated Loss', f"${loss:.2f}" if loss else None),
+            ]
 
-def main():
-    # Initialize session state first
-    init_global_session_state()
-    
-    # Call the navbar function
-    navbar()
-    
-    # Handle scrolling if navigation was clicked
-    if st.session_state.get('scroll_to'):
-        target = st.session_state.scroll_to
-        st.markdown(f"""
-        <script>
-            setTimeout(function() {{
-                const element = document.getElementById('{target}');
-                if (element) {{
-                    element.scrollIntoView({{ behavior: 'smooth', block: 'start' }});
-                }}
-            }}, 100);
-        </script>
-        """, unsafe_allow_html=True)
-        # Clear the scroll target
-        del st.session_state.scroll_to
-    
-    st.markdown("---")
-    
-    # Hero Section - Science.io style
-    st.markdown("""
-    <div class="content-container">
-        <div class="hero-section">
-            <h1>Stop Fleet Fraud Before It Costs You Thousands</h1>
-            <h2>AI-powered fraud detection that analyzes your fuel, GPS, and job data to uncover theft, misuse, and policy violations in minutes.</h2>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # CTA Button with navigation
-    col1, col2, col3 = st.columns([1, 1, 1])
-    with col2:
-        if st.button("🚀 Try FleetAudit Free", type="primary", use_container_width=True, key="hero_cta"):
-            st.switch_page("pages/1_Product.py")
-    
-    # Features Section with Science.io styling
-    st.markdown("""
-    <div class="content-container">
-        <div class="features-section scroll-section" id="features">
-            <h2 class="section-heading">Why FleetAudit.io?</h2>
-            <div class="features-grid">
-                <div class="feature-card">
-                    <h3>🔍 AI-Powered Detection</h3>
-                    <p>Advanced algorithms detect fraud patterns humans miss - shared cards, ghost jobs, after-hours abuse, and more.</p>
-                </div>
-                <div class="feature-card">
-                    <h3>💰 Immediate ROI</h3>
-                    <p>Customers typically recover 10x their subscription cost in the first month by stopping ongoing fraud.</p>
-                </div>
-                <div class="feature-card">
-                    <h3>📊 Professional Reports</h3>
-                    <p>Generate detailed PDF reports with evidence for HR, management, and legal proceedings.</p>
-                </div>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Demo Section with new styling
-    st.markdown("""
-    <div class="content-container">
-        <div class="demo-section scroll-section" id="demo">
-            <div class="demo-header">
-                <h2>🎯 See FleetAudit.io in Action</h2>
-                <p style="color: #6b7280; font-size: 1.1rem; margin-bottom: 2rem; text-align: center;">Select a sample fleet below to see how our AI detects fraud and policy violations:</p>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Demo selector
-    demo_data = get_demo_data()
-    
+        body = "".join(_row(label, value) for label, value in pairs if value)
+        with st.expander(title):
+            st.markdown(f"<ul>{body}</ul>", unsafe_allow_html=True)
+
+@_fragment
+def demo_panel(demo_data):
+    """Demo selector and results, scoped as a fragment.
+
+    Selecting a scenario or running the analysis reruns only this block
+    instead of the whole landing page.
+    """
     col1, col2 = st.columns([1, 3])
-    
+
     with col1:
         scenario_names = list(demo_data.keys())
         selected_scenario = st.selectbox(
@@ -656,76 +572,141 @@ def main():
             scenario_names,
             help="Select different fleet examples to see various types of fraud detection"
         )
-        
+
         scenario_info = demo_data[selected_scenario]
         st.info(f"**{selected_scenario}**\n\n{scenario_info['description']}")
-        
+
         if st.button("🔍 Run Fraud Analysis", type="primary", use_container_width=True):
             st.session_state.show_demo = True
-    
+
     with col2:
         if st.session_state.get('show_demo', False):
             st.markdown(f"### 🚨 Fraud Detection Results: {selected_scenario}")
             display_demo_results(selected_scenario, demo_data[selected_scenario])
-    
-    # Pricing Section with Science.io styling
-    st.markdown("""
-    <div class="content-container">
-        <div class="pricing-section scroll-section" id="pricing">
-            <h2 class="section-heading">💳 Simple, Transparent Pricing</h2>
-            <div class="pricing-card">
-                <h3 style="color: #111827; font-size: 1.5rem; margin-bottom: 1rem;">Professional Plan</h3>
-                <div class="price">$99<span style="font-size: 1rem; color: #6b7280; font-weight: 400;">/month</span></div>
-                <div style="text-align: left; color: #374151; line-height: 1.8;">
-                    ✅ Unlimited fleet data analysis<br>
-                    ✅ All fraud detection features<br>
-                    ✅ PDF report generation<br>
-                    ✅ Email alerts & notifications<br>
-                    ✅ Priority support
-                </div>
+
+# Static page sections, prebuilt once at import time. Interactive widgets
+# (hero CTA, demo fragment, trial button) interleave with them, so the page
+# is emitted as a few contiguous static runs rather than one call per section
+
+# Navbar, rule, and hero. Pure-HTML anchor nav: the browser scrolls to the
+# section IDs natively (scroll-behavior: smooth is in PAGE_CSS), so nav
+# clicks no longer round-trip through session_state and a full script rerun
+HEADER_HTML = """
+<nav class="fa-nav">
+    <span class="fa-nav-brand">🚚 FleetAudit</span>
+    <a href="#features">Features</a>
+    <a href="#demo">Demo</a>
+    <a href="#pricing">Pricing</a>
+    <a href="/Product" target="_self" class="fa-nav-cta">Try FleetAudit</a>
+</nav>
+<hr>
+<div class="content-container">
+    <div class="hero-section">
+        <h1>Stop Fleet Fraud Before It Costs You Thousands</h1>
+        <h2>AI-powered fraud detection that analyzes your fuel, GPS, and job data to uncover theft, misuse, and policy violations in minutes.</h2>
+    </div>
+</div>
+"""
+
+# Features and the demo header, between the hero CTA and the demo fragment
+FEATURES_DEMO_HTML = """
+<div class="content-container">
+    <div class="features-section scroll-section" id="features">
+        <h2 class="section-heading">Why FleetAudit.io?</h2>
+        <div class="features-grid">
+            <div class="feature-card">
+                <h3>🔍 AI-Powered Detection</h3>
+                <p>Advanced algorithms detect fraud patterns humans miss - shared cards, ghost jobs, after-hours abuse, and more.</p>
+            </div>
+            <div class="feature-card">
+                <h3>💰 Immediate ROI</h3>
+                <p>Customers typically recover 10x their subscription cost in the first month by stopping ongoing fraud.</p>
+            </div>
+            <div class="feature-card">
+                <h3>📊 Professional Reports</h3>
+                <p>Generate detailed PDF reports with evidence for HR, management, and legal proceedings.</p>
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Start trial button
-    col1, col2, col3 = st.columns([1, 1, 1])
-    with col2:
-        if st.button("🚀 Start Free Trial", type="primary", use_container_width=True):
-            st.balloons()
-            st.success("🎉 Ready to start your free trial! Subscription system coming soon.")
-    
-    # Call to Action with Science.io styling
-    st.markdown("""
-    <div class="content-container">
-        <div style="text-align: center; padding: 4rem 2rem; background: #f9fafb; border-radius: 1rem; margin: 3rem 0;">
-            <h2 style="color: #111827; font-size: 2rem; font-weight: 600; margin-bottom: 1rem;">Ready to Stop Fleet Fraud?</h2>
-            <p style="color: #6b7280; font-size: 1.2rem; margin-bottom: 0;">Join hundreds of fleet managers who've recovered thousands in stolen fuel and time.</p>
+    <div class="demo-section scroll-section" id="demo">
+        <div class="demo-header">
+            <h2>🎯 See FleetAudit.io in Action</h2>
+            <p style="color: #6b7280; font-size: 1.1rem; margin-bottom: 2rem; text-align: center;">Select a sample fleet below to see how our AI detects fraud and policy violations:</p>
         </div>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Clean Footer
-    st.markdown("""
-    <div class="content-container">
-        <div style="border-top: 1px solid #e5e7eb; padding: 3rem 0; margin-top: 4rem;">
-            <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 2rem; color: #6b7280;">
-                <div>
-                    <h4 style="color: #111827; font-weight: 600; margin-bottom: 1rem;">FleetAudit.io</h4>
-                    <p>AI-powered fleet fraud detection</p>
-                </div>
-                <div>
-                    <h4 style="color: #111827; font-weight: 600; margin-bottom: 1rem;">Features</h4>
-                    <p>• Shared card detection<br>• Ghost job analysis<br>• After-hours monitoring<br>• GPS cross-referencing</p>
-                </div>
-                <div>
-                    <h4 style="color: #111827; font-weight: 600; margin-bottom: 1rem;">Support</h4>
-                    <p>• 24/7 customer support<br>• Implementation assistance<br>• Training & onboarding</p>
-                </div>
+</div>
+"""
+
+PRICING_HTML = """
+<div class="content-container">
+    <div class="pricing-section scroll-section" id="pricing">
+        <h2 class="section-heading">💳 Simple, Transparent Pricing</h2>
+        <div class="pricing-card">
+            <h3 style="color: #111827; font-size: 1.5rem; margin-bottom: 1rem;">Professional Plan</h3>
+            <div class="price">$99<span style="font-size: 1rem; color: #6b7280; font-weight: 400;">/month</span></div>
+            <div style="text-align: left; color: #374151; line-height: 1.8;">
+                ✅ Unlimited fleet data analysis<br>
+                ✅ All fraud detection features<br>
+                ✅ PDF report generation<br>
+                ✅ Email alerts & notifications<br>
+                ✅ Priority support
+            </div>
+        </div>
+    </div>
+</div>
+"""
+
+# Closing call to action plus footer
+CTA_FOOTER_HTML = """
+<div class="content-container">
+    <div style="text-align: center; padding: 4rem 2rem; background: #f9fafb; border-radius: 1rem; margin: 3rem 0;">
+        <h2 style="color: #111827; font-size: 2rem; font-weight: 600; margin-bottom: 1rem;">Ready to Stop Fleet Fraud?</h2>
+        <p style="color: #6b7280; font-size: 1.2rem; margin-bottom: 0;">Join hundreds of fleet managers who've recovered thousands in stolen fuel and time.</p>
+    </div>
+    <div style="border-top: 1px solid #e5e7eb; padding: 3rem 0; margin-top: 4rem;">
+        <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 2rem; color: #6b7280;">
+            <div>
+                <h4 style="color: #111827; font-weight: 600; margin-bottom: 1rem;">FleetAudit.io</h4>
+                <p>AI-powered fleet fraud detection</p>
+            </div>
+            <div>
+                <h4 style="color: #111827; font-weight: 600; margin-bottom: 1rem;">Features</h4>
+                <p>• Shared card detection<br>• Ghost job analysis<br>• After-hours monitoring<br>• GPS cross-referencing</p>
+            </div>
+            <div>
+                <h4 style="color: #111827; font-weight: 600; margin-bottom: 1rem;">Support</h4>
+                <p>• 24/7 customer support<br>• Implementation assistance<br>• Training & onboarding</p>
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+</div>
+"""
+
+def main():
+    # Navbar and hero in one delta
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
+
+    # CTA Button with navigation - the .center-cta marker div makes the CSS
+    # flex-center the button that follows, replacing a throwaway
+    # three-column layout
+    st.markdown('<div class="center-cta"></div>', unsafe_allow_html=True)
+    if st.button("🚀 Try FleetAudit Free", type="primary", key="hero_cta"):
+        st.switch_page("pages/1_Product.py")
+
+    st.markdown(FEATURES_DEMO_HTML, unsafe_allow_html=True)
+
+    # Demo selector - reruns in isolation as a fragment
+    demo_panel(DEMO_DATA)
+
+    st.markdown(PRICING_HTML, unsafe_allow_html=True)
+
+    # Start trial button, centered via the same marker
+    st.markdown('<div class="center-cta"></div>', unsafe_allow_html=True)
+    if st.button("🚀 Start Free Trial", type="primary"):
+        st.balloons()
+        st.success("🎉 Ready to start your free trial! Subscription system coming soon.")
+
+    st.markdown(CTA_FOOTER_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,6 +1,6 @@
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
-from anthropic import Anthropic
 import os
 import json
 
@@ -9,6 +9,8 @@ class AIViolationInsights:
     
     def __init__(self, api_key: Optional[str] = None):
         """Initialize with Claude API key"""
+        # Import lazily - the anthropic SDK is heavy and only needed here
+        from anthropic import Anthropic
         self.client = Anthropic(api_key=api_key or os.getenv('ANTHROPIC_API_KEY'))
     
     def analyze_violation(self, violation: Dict, context_data: Dict = None) -> Dict:
@@ -44,31 +46,42 @@ class AIViolationInsights:
             violation['ai_insights'] = {'error': str(e)}
             return violation
     
-    def analyze_violations_batch(self, violations: List[Dict], context_data: Dict = None, max_violations: int = 10) -> List[Dict]:
-        """Analyze multiple violations with AI insights (limited for performance)"""
-        enhanced_violations = []
-        
+    def analyze_violations_batch(self, violations: List[Dict], context_data: Dict = None,
+                                 max_violations: int = 10, max_concurrency: int = 8) -> List[Dict]:
+        """Analyze multiple violations with AI insights (limited for performance)
+
+        The per-violation API calls are I/O-bound, so they run concurrently on
+        a small thread pool - wall clock is roughly the slowest call instead of
+        the sum of all of them. Results keep the original violation order.
+        """
         # Limit the number of violations to analyze to prevent timeouts
         violations_to_analyze = violations[:max_violations]
         remaining_violations = violations[max_violations:]
-        
+
         print(f"Analyzing {len(violations_to_analyze)} violations with AI (limit: {max_violations})")
-        
-        for i, violation in enumerate(violations_to_analyze):
+
+        enhanced_violations = [None] * len(violations_to_analyze)
+
+        def _analyze_one(index_violation):
+            i, violation = index_violation
             try:
-                print(f"Analyzing violation {i+1}/{len(violations_to_analyze)}")
-                enhanced = self.analyze_violation(violation, context_data)
-                enhanced_violations.append(enhanced)
+                return i, self.analyze_violation(violation, context_data)
             except Exception as e:
                 print(f"Failed to analyze violation {i+1}: {e}")
                 violation['ai_insights'] = {'error': str(e)}
-                enhanced_violations.append(violation)
-        
+                return i, violation
+
+        if violations_to_analyze:
+            workers = min(max_concurrency, len(violations_to_analyze))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for i, enhanced in executor.map(_analyze_one, enumerate(violations_to_analyze)):
+                    enhanced_violations[i] = enhanced
+
         # Add remaining violations without AI analysis
         for violation in remaining_violations:
             violation['ai_insights'] = {'note': 'Not analyzed - exceeds batch limit'}
             enhanced_violations.append(violation)
-        
+
         return enhanced_violations
     
     def _build_analysis_prompt(self, violation: Dict, context_data: Dict = None) -> str:
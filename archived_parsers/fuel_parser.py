@@ -189,7 +189,12 @@ class FuelParser:
     @staticmethod
     def auto_parse(file_path: str, provider: str = None) -> pd.DataFrame:
         """Auto-detect and parse fuel data based on provider or column headers"""
-        
+
+        # Known provider - dispatch directly without sniffing the file
+        parser = PROVIDER_PARSERS.get(provider)
+        if parser is not None:
+            return parser(file_path)
+
         # Read first few rows to detect format
         sample_df = pd.read_csv(file_path, nrows=5)
         column_names = [col.lower().strip() for col in sample_df.columns]
@@ -208,23 +213,20 @@ class FuelParser:
         fuelman_indicators = ['trans date', 'merchant', 'unit number']
         
         # Check for WEX format (including ChatGPT separated date/time format)
-        if (provider == 'wex' or 
-            any(indicator in column_names for indicator in wex_indicators) or
+        if (any(indicator in column_names for indicator in wex_indicators) or
             'transaction date' in column_names or
             ('transaction date' in column_names and 'transaction time' in column_names)):
             print(f"Detected WEX format based on columns: {sample_df.columns.tolist()}")
             return FuelParser.parse_wex(file_path)
         
         # Check for Fleetcor format
-        elif (provider == 'fleetcor' or 
-              any(indicator in column_names for indicator in fleetcor_indicators) or
+        elif (any(indicator in column_names for indicator in fleetcor_indicators) or
               'merchant name' in column_names):
             print(f"Detected Fleetcor format based on columns: {sample_df.columns.tolist()}")
             return FuelParser.parse_fleetcor(file_path)
         
         # Check for Fuelman format
-        elif (provider == 'fuelman' or 
-              any(indicator in column_names for indicator in fuelman_indicators) or
+        elif (any(indicator in column_names for indicator in fuelman_indicators) or
               'trans date' in column_names):
             print(f"Detected Fuelman format based on columns: {sample_df.columns.tolist()}")
             return FuelParser.parse_fuelman(file_path)
@@ -500,4 +502,12 @@ class FuelParser:
         except:
             # If all else fails, return original series
             print(f"Warning: Could not parse timestamps. Sample values: {timestamp_series.head().tolist()}")
-            return timestamp_series
\ No newline at end of file
+            return timestamp_series
+
+# Explicit provider -> parser dispatch table, resolved once at import time
+PROVIDER_PARSERS = {
+    'wex': FuelParser.parse_wex,
+    'fleetcor': FuelParser.parse_fleetcor,
+    'fuelman': FuelParser.parse_fuelman,
+    'generic': FuelParser.parse_generic,
+}
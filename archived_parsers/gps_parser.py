@@ -70,13 +70,18 @@ class GPSParser:
     @staticmethod
     def auto_parse(file_path: str, provider: str = None) -> pd.DataFrame:
         """Auto-detect and parse GPS data based on provider or column headers"""
-        
+
+        # Known provider - dispatch directly without sniffing the file
+        parser = PROVIDER_PARSERS.get(provider)
+        if parser is not None:
+            return parser(file_path)
+
         # Read first few rows to detect format
         sample_df = pd.read_csv(file_path, nrows=5)
-        
-        if provider == 'samsara' or 'Vehicle' in sample_df.columns:
+
+        if 'Vehicle' in sample_df.columns:
             return GPSParser.parse_samsara(file_path)
-        elif provider == 'verizon' or 'VehicleName' in sample_df.columns:
+        elif 'VehicleName' in sample_df.columns:
             return GPSParser.parse_verizon(file_path)
         else:
             # Try generic parsing
@@ -126,5 +131,12 @@ class GPSParser:
         for col in required_cols:
             if col not in normalized_df.columns:
                 normalized_df[col] = None
-        
-        return normalized_df[required_cols]
\ No newline at end of file
+
+        return normalized_df[required_cols]
+
+# Explicit provider -> parser dispatch table, resolved once at import time
+PROVIDER_PARSERS = {
+    'samsara': GPSParser.parse_samsara,
+    'verizon': GPSParser.parse_verizon,
+    'generic': GPSParser.parse_generic,
+}
\ No newline at end of file
@@ -116,18 +116,23 @@ class JobParser:
     @staticmethod
     def auto_parse(file_path: str, provider: str = None) -> pd.DataFrame:
         """Auto-detect and parse job data based on provider or column headers"""
-        
+
+        # Known provider - dispatch directly without sniffing the file
+        parser = PROVIDER_PARSERS.get(provider)
+        if parser is not None:
+            return parser(file_path)
+
         # Read first few rows to detect format
         if file_path.endswith('.xlsx') or file_path.endswith('.xls'):
             sample_df = pd.read_excel(file_path, nrows=5)
         else:
             sample_df = pd.read_csv(file_path, nrows=5)
-        
-        if provider == 'jobber' or 'Job Number' in sample_df.columns:
+
+        if 'Job Number' in sample_df.columns:
             return JobParser.parse_jobber(file_path)
-        elif provider == 'housecall_pro' or 'Job ID' in sample_df.columns:
+        elif 'Job ID' in sample_df.columns:
             return JobParser.parse_housecall_pro(file_path)
-        elif provider == 'servicetitan' or 'Appointment Start' in sample_df.columns:
+        elif 'Appointment Start' in sample_df.columns:
             return JobParser.parse_servicetitan(file_path)
         else:
             # Try generic parsing
@@ -178,4 +183,12 @@ class JobParser:
             if col not in normalized_df.columns:
                 normalized_df[col] = None
         
-        return normalized_df[required_cols]
\ No newline at end of file
+        return normalized_df[required_cols]
+
+# Explicit provider -> parser dispatch table, resolved once at import time
+PROVIDER_PARSERS = {
+    'jobber': JobParser.parse_jobber,
+    'housecall_pro': JobParser.parse_housecall_pro,
+    'servicetitan': JobParser.parse_servicetitan,
+    'generic': JobParser.parse_generic,
+}
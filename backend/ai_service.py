@@ -1,6 +1,5 @@
 import os
 from typing import Dict, Optional
-from anthropic import Anthropic
 
 class FleetAuditAIService:
     """Centralized AI service for FleetAudit.io SaaS"""
@@ -11,6 +10,8 @@ class FleetAuditAIService:
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY environment variable required")
         
+        # Import lazily - the anthropic SDK is heavy and only needed here
+        from anthropic import Anthropic
         self.client = Anthropic(api_key=api_key)
         self.usage_tracking = {}
     
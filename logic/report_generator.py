@@ -1,4 +1,6 @@
 import os
+import hashlib
+import json
 import pandas as pd
 from datetime import datetime, timedelta
 from jinja2 import Template, Environment, FileSystemLoader
@@ -14,6 +16,18 @@ except ImportError:
     WEASYPRINT_AVAILABLE = False
     print("WeasyPrint not available - PDF generation disabled")
 
+# One Jinja environment per template dir, shared across generator instances -
+# the environment caches compiled templates, so repeated ReportGenerator()
+# construction stops re-reading and re-compiling report.html
+_JINJA_ENVS = {}
+
+def _get_jinja_env(template_dir: str) -> Environment:
+    env = _JINJA_ENVS.get(template_dir)
+    if env is None:
+        env = Environment(loader=FileSystemLoader(template_dir))
+        _JINJA_ENVS[template_dir] = env
+    return env
+
 class ReportGenerator:
     """Generate HTML and PDF reports from audit results"""
     
@@ -22,8 +36,16 @@ class ReportGenerator:
             template_dir = os.path.join(os.path.dirname(__file__), '..', 'templates')
         
         self.template_dir = template_dir
-        self.env = Environment(loader=FileSystemLoader(template_dir))
-    
+        self.env = _get_jinja_env(template_dir)
+        self._html_cache = (None, None)
+        self._pdf_cache = (None, None)
+
+    @staticmethod
+    def _inputs_key(*parts) -> str:
+        """Stable hash of report inputs for memoization"""
+        serialized = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.blake2b(serialized.encode()).hexdigest()
+
     def generate_html_report(self, audit_results: Dict, summary_stats: Dict, 
                            company_name: str = "Fleet Company", 
                            start_date: str = None, end_date: str = None) -> str:
@@ -33,9 +55,17 @@ class ReportGenerator:
         if start_date is None or end_date is None:
             end_date = datetime.now().strftime('%Y-%m-%d')
             start_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-        
+
+        # Rendering is deterministic for a given set of inputs (apart from the
+        # generated-at stamp), so reuse the last result on repeated calls with
+        # unchanged audit data - e.g. preview plus PDF on the same results
+        cache_key = self._inputs_key(audit_results, summary_stats, company_name,
+                                     start_date, end_date)
+        if cache_key == self._html_cache[0]:
+            return self._html_cache[1]
+
         template = self.env.get_template('report.html')
-        
+
         # Prepare context for template
         context = {
             'company_name': company_name,
@@ -45,15 +75,23 @@ class ReportGenerator:
             'violations': audit_results,
             'summary_stats': summary_stats
         }
-        
-        return template.render(context)
+
+        html_content = template.render(context)
+        self._html_cache = (cache_key, html_content)
+        return html_content
     
     def generate_pdf_report(self, audit_results: Dict, summary_stats: Dict,
                            company_name: str = "Fleet Company",
                            start_date: str = None, end_date: str = None,
                            output_path: str = None) -> str:
         """Generate PDF report from audit results"""
-        
+
+        # Reuse the previously written file when the inputs haven't changed
+        cache_key = self._inputs_key(audit_results, summary_stats, company_name,
+                                     start_date, end_date, output_path)
+        if cache_key == self._pdf_cache[0] and os.path.exists(self._pdf_cache[1]):
+            return self._pdf_cache[1]
+
         # Generate HTML first
         html_content = self.generate_html_report(
             audit_results, summary_stats, company_name, start_date, end_date
@@ -70,6 +108,7 @@ class ReportGenerator:
             html_output_path = output_path.replace('.pdf', '.html') if output_path else os.path.join(reports_dir, f'fleet_audit_report_{timestamp}.html')
             with open(html_output_path, 'w', encoding='utf-8') as f:
                 f.write(html_content)
+            self._pdf_cache = (cache_key, html_output_path)
             return html_output_path
         
         if output_path is None:
@@ -80,6 +119,7 @@ class ReportGenerator:
             font_config = FontConfiguration()
             html_doc = HTML(string=html_content)
             html_doc.write_pdf(output_path, font_config=font_config)
+            self._pdf_cache = (cache_key, output_path)
             return output_path
         except Exception as e:
             # Fallback: save as HTML if PDF generation fails
@@ -1,6 +1,7 @@
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
-from haversine import haversine, Unit
+from haversine import haversine, haversine_vector, Unit
 from typing import Tuple, List, Dict, Optional
 
 def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -51,22 +52,24 @@ def find_gps_near_location(gps_df: pd.DataFrame, lat: float, lon: float,
     if lat is None or lon is None:
         return pd.DataFrame()
     
-    # Filter by time window first (more efficient)
-    time_mask = gps_df['timestamp'].apply(
-        lambda t: is_within_time_window(t, timestamp, time_window_minutes)
-    )
-    time_filtered = gps_df[time_mask]
-    
+    # Filter by time window first (more efficient); NaT diffs compare False
+    time_diff_minutes = (gps_df['timestamp'] - timestamp).abs().dt.total_seconds() / 60
+    time_filtered = gps_df[time_diff_minutes <= time_window_minutes]
+
     if time_filtered.empty:
         return pd.DataFrame()
-    
-    # Then filter by distance
-    distance_mask = time_filtered.apply(
-        lambda row: is_within_distance(row['lat'], row['lon'], lat, lon, distance_miles),
-        axis=1
-    )
-    
-    return time_filtered[distance_mask]
+
+    # Then filter by distance - one vectorized haversine over all candidate
+    # points instead of a per-row apply
+    coords = time_filtered[['lat', 'lon']].to_numpy(dtype=float)
+    valid = ~np.isnan(coords).any(axis=1)
+    distances = np.full(len(coords), np.inf)
+    if valid.any():
+        distances[valid] = haversine_vector(
+            coords[valid], np.array([[lat, lon]]), unit=Unit.MILES, comb=True
+        ).ravel()
+
+    return time_filtered[distances <= distance_miles]
 
 def detect_idle_periods(gps_df: pd.DataFrame, min_idle_minutes: int = 10, 
                        max_speed_mph: float = 3) -> List[Dict]:
@@ -321,14 +321,25 @@ class ViolationDeduplicator:
                 'violation_count': data['violation_count'],
                 'highest_single_incident': data['highest_single_incident'],
                 'violation_methods': list(data['violation_types']),
-                'summary_text': f"Vehicle {vehicle_id} flagged for ${data['total_loss']:.2f} of likely stolen fuel this period"
+                'summary_text': f"Vehicle {vehicle_id} flagged for ${data['total_loss']:.2f} of likely stolen fuel this period",
+                # Pre-formatted display strings so render paths don't reformat
+                # these on every refresh
+                'total_loss_display': f"${data['total_loss']:.2f}",
+                'weekly_estimate_display': f"${weekly_loss:.2f}",
+                'monthly_estimate_display': f"${monthly_loss:.2f}"
             }
-        
+
+        weekly_fleet_estimate = total_fleet_loss * (7 / time_period_days) if time_period_days > 0 else 0
+        monthly_fleet_estimate = total_fleet_loss * (30 / time_period_days) if time_period_days > 0 else 0
+
         # Overall fleet summary
         summary = {
             'total_fleet_loss': total_fleet_loss,
-            'weekly_fleet_estimate': total_fleet_loss * (7 / time_period_days) if time_period_days > 0 else 0,
-            'monthly_fleet_estimate': total_fleet_loss * (30 / time_period_days) if time_period_days > 0 else 0,
+            'weekly_fleet_estimate': weekly_fleet_estimate,
+            'monthly_fleet_estimate': monthly_fleet_estimate,
+            'total_fleet_loss_display': f"${total_fleet_loss:.2f}",
+            'weekly_fleet_estimate_display': f"${weekly_fleet_estimate:.2f}",
+            'monthly_fleet_estimate_display': f"${monthly_fleet_estimate:.2f}",
             'total_violations': len(consolidated_violations),
             'vehicles_flagged': len(vehicle_losses),
             'vehicle_summaries': vehicle_summaries,
@@ -336,4 +347,22 @@ class ViolationDeduplicator:
                                 key=lambda v: vehicle_summaries[v]['total_loss']) if vehicle_summaries else None
         }
         
-        return summary
\ No newline at end of file
+        return summary
+
+    def vehicle_summary_frame(self, financial_summary: Dict) -> pd.DataFrame:
+        """Flatten per-vehicle summaries into a single DataFrame
+
+        Lets a UI render the whole fleet as one table widget instead of one
+        expander per vehicle, which gets slow for large fleets.
+        """
+        columns = ['total_loss', 'violation_count', 'weekly_estimate',
+                   'monthly_estimate', 'highest_single_incident']
+
+        vehicle_summaries = financial_summary.get('vehicle_summaries', {})
+        if not vehicle_summaries:
+            return pd.DataFrame(columns=columns)
+
+        frame = pd.DataFrame.from_dict(vehicle_summaries, orient='index')
+        frame.index.name = 'vehicle_id'
+
+        return frame[columns].sort_values('total_loss', ascending=False)
\ No newline at end of file
@@ -2,7 +2,6 @@ import pandas as pd
 import json
 import io
 from typing import Dict, List, Optional
-from anthropic import Anthropic
 import os
 from datetime import datetime
 
@@ -19,6 +18,8 @@ class AICsvNormalizer:
             self.ai_service = FleetAuditAIService()
         else:
             # Direct API access (for development/testing)
+            # Import lazily - the anthropic SDK is heavy and only needed here
+            from anthropic import Anthropic
             self.client = Anthropic(api_key=api_key or os.getenv('ANTHROPIC_API_KEY'))
         
         # Target schema that audit logic expects
@@ -1,13 +1,14 @@
 import pandas as pd
 import json
 from typing import Dict, List, Optional
-from anthropic import Anthropic
 import os
 
 class AIOnlyParser:
     """100% AI-powered parser - optimized for cost and performance"""
     
     def __init__(self, api_key: Optional[str] = None):
+        # Import lazily - the anthropic SDK is heavy and only needed here
+        from anthropic import Anthropic
         # Try multiple ways to get API key for Streamlit compatibility
         if api_key:
             self.client = Anthropic(api_key=api_key)